@@ -0,0 +1,168 @@
+"""
+Startup Benchmark
+
+Starts the production server with gunicorn.conf.py, once with the worker
+warmup enabled and once with GUNICORN_WARMUP=false, and reports:
+
+    time to ready     - seconds from launch until every worker is serving
+    first request     - latency of the first database-backed requests
+                        once the server is up (cold vs. warm workers)
+    memory per worker - resident (RSS) and proportional (PSS) set size,
+                        sampled once every worker is serving
+
+Usage:
+    python benchmarks/startup.py [--runs N]
+
+Memory figures are read from /proc and are only available on Linux.
+"""
+
+import argparse
+import multiprocessing
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+
+PORT = os.getenv("PORT", "8080")
+BASE_URL = f"http://127.0.0.1:{PORT}"
+STARTUP_TIMEOUT = 60
+WORKERS = int(os.getenv("GUNICORN_WORKERS", str(multiprocessing.cpu_count())))
+
+# Lines logged by gunicorn.conf.py once a worker is ready to serve
+READY_MESSAGES = ("Worker warmed up", "serving cold")
+
+# Requests timed once the server is up; each one runs a different query
+FIRST_REQUEST_PATHS = [
+    "/products",
+    "/products/0",
+    "/products?name=Hat",
+    "/products?category=FOOD",
+    "/products?available=true",
+]
+
+
+def wait_for_server(process):
+    """Polls the server until it answers and returns the elapsed seconds"""
+    start = time.monotonic()
+    while time.monotonic() - start < STARTUP_TIMEOUT:
+        if process.poll() is not None:
+            sys.exit(f"Server exited with code {process.returncode}")
+        try:
+            with urllib.request.urlopen(f"{BASE_URL}/", timeout=1) as response:
+                if response.status == 200:
+                    return time.monotonic() - start
+        except OSError:
+            # covers refused connections and workers too busy warming up
+            # to answer within the timeout
+            time.sleep(0.01)
+    sys.exit(f"Server did not answer within {STARTUP_TIMEOUT} seconds")
+
+
+def wait_for_workers(process, log_path):
+    """Waits until every worker has reported that it is ready to serve"""
+    start = time.monotonic()
+    while time.monotonic() - start < STARTUP_TIMEOUT:
+        if process.poll() is not None:
+            sys.exit(f"Server exited with code {process.returncode}")
+        with open(log_path, encoding="utf-8") as log:
+            ready = sum(
+                1 for line in log if any(message in line for message in READY_MESSAGES)
+            )
+        if ready >= WORKERS:
+            return
+        time.sleep(0.1)
+    sys.exit(f"Workers did not become ready within {STARTUP_TIMEOUT} seconds")
+
+
+def first_request_latency():
+    """Returns the mean seconds taken by the first request to each path"""
+    total = 0.0
+    for path in FIRST_REQUEST_PATHS:
+        start = time.monotonic()
+        try:
+            with urllib.request.urlopen(f"{BASE_URL}{path}", timeout=STARTUP_TIMEOUT) as response:
+                response.read()
+        except urllib.error.HTTPError:
+            # a 404 for a missing product still went through the database
+            pass
+        total += time.monotonic() - start
+    return total / len(FIRST_REQUEST_PATHS)
+
+
+def worker_memory(master_pid):
+    """Returns (pid, rss_kb, pss_kb) for every worker of the master"""
+    children_file = f"/proc/{master_pid}/task/{master_pid}/children"
+    with open(children_file, encoding="utf-8") as children:
+        pids = [int(pid) for pid in children.read().split()]
+
+    results = []
+    for pid in pids:
+        fields = {}
+        with open(f"/proc/{pid}/smaps_rollup", encoding="utf-8") as rollup:
+            for line in rollup:
+                parts = line.split()
+                if len(parts) == 3 and parts[2] == "kB":
+                    fields[parts[0].rstrip(":")] = int(parts[1])
+        results.append((pid, fields.get("Rss", 0), fields.get("Pss", 0)))
+    return results
+
+
+def run_once(warmup):
+    """Launches the server once, measures it and shuts it down"""
+    environ = dict(os.environ, GUNICORN_WARMUP="true" if warmup else "false")
+    with tempfile.NamedTemporaryFile(suffix=".log") as log:
+        start = time.monotonic()
+        process = subprocess.Popen(  # pylint: disable=consider-using-with
+            [sys.executable, "-m", "gunicorn", "--error-logfile", log.name,
+             "--workers", str(WORKERS), "service:app"],
+            env=environ,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            wait_for_server(process)
+            wait_for_workers(process, log.name)
+            ready = time.monotonic() - start
+            latency = first_request_latency()
+            memory = worker_memory(process.pid)
+        finally:
+            process.send_signal(signal.SIGTERM)
+            process.wait()
+    return ready, latency, memory
+
+
+def median(values):
+    """Returns the median of a list of numbers"""
+    values = sorted(values)
+    return values[len(values) // 2]
+
+
+def main():
+    """Runs the benchmark and prints a summary"""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--runs", type=int, default=5, help="server launches per mode")
+    args = parser.parse_args()
+
+    for mode, warmup in [("warm", True), ("cold", False)]:
+        readies, latencies, memories = [], [], []
+        for run in range(1, args.runs + 1):
+            ready, latency, memory = run_once(warmup)
+            readies.append(ready)
+            latencies.append(latency)
+            memories.extend(memory)
+            print(f"{mode} run {run}: ready after {ready * 1000:.1f} ms, "
+                  f"first request {latency * 1000:.2f} ms")
+
+        print(f"{mode.capitalize()} workers (median of {args.runs} runs):")
+        print(f"    time to ready: {median(readies) * 1000:.1f} ms")
+        print(f"    first request: {median(latencies) * 1000:.2f} ms")
+        print(f"    memory per worker: RSS {median([m[1] for m in memories]) / 1024:.1f} MiB, "
+              f"PSS {median([m[2] for m in memories]) / 1024:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Gunicorn configuration for the Product Service
+
+Start the production server with:
+
+    gunicorn service:app
+
+Gunicorn reads this file automatically from the working directory.
+Every setting can be overridden with the environment variables below.
+Command line options such as --error-logfile take precedence over this file.
+"""
+
+import multiprocessing
+import os
+
+######################################################################
+# SERVER SOCKET
+######################################################################
+bind = f"0.0.0.0:{os.getenv('PORT', '8080')}"
+backlog = int(os.getenv("GUNICORN_BACKLOG", "2048"))
+
+######################################################################
+# WORKER PROCESSES
+######################################################################
+# Load the application once in the master so that workers are forked with
+# the imports already done and share those pages copy-on-write
+preload_app = True
+
+# One process per core for CPU work, plus a few threads per process to
+# overlap the time spent waiting on the database
+workers = int(os.getenv("GUNICORN_WORKERS", str(multiprocessing.cpu_count())))
+threads = int(os.getenv("GUNICORN_THREADS", "4"))
+worker_class = "gthread"
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "30"))
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", "2"))
+
+######################################################################
+# LOGGING
+######################################################################
+loglevel = os.getenv("GUNICORN_LOG_LEVEL", "info")
+accesslog = "-"
+errorlog = "-"
+
+
+######################################################################
+# SERVER HOOKS
+######################################################################
+def post_fork(server, worker):  # pylint: disable=unused-argument
+    """Give each worker its own database connection pool"""
+    from service import app  # pylint: disable=import-outside-toplevel
+    from service.warmup import reset_connections  # pylint: disable=import-outside-toplevel
+
+    reset_connections(app)
+
+
+def post_worker_init(worker):
+    """Warm the worker up before it starts accepting requests"""
+    from service import app  # pylint: disable=import-outside-toplevel
+    from service.warmup import warm_up  # pylint: disable=import-outside-toplevel
+
+    if os.getenv("GUNICORN_WARMUP", "true").lower() not in ["true", "yes", "1"]:
+        worker.log.info("Warmup disabled, serving cold")
+        return
+    budget = float(os.getenv("GUNICORN_WARMUP_BUDGET", "10"))
+    try:
+        elapsed = warm_up(app, budget=budget, heartbeat=worker.notify)
+    except Exception as error:  # pylint: disable=broad-except
+        worker.log.warning("Warmup failed, serving cold: %s", error)
+    else:
+        worker.log.info("Worker warmed up in %.3f seconds", elapsed)
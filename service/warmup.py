@@ -0,0 +1,160 @@
+"""
+Worker Warmup
+
+Primes a freshly forked worker before it accepts live traffic:
+
+    reset_connections(app) - drops the database pool inherited from the parent
+    warm_up(app)           - opens connections and requests every read-only
+                             route once, priming the statement cache
+"""
+
+import threading
+import time
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import NullPool
+
+# Dummy value substituted for every variable part of a route (e.g. <int:id>)
+# so the route can be requested without depending on existing data
+WARMUP_ARG = 0
+
+# Seconds a worker may spend warming up before it starts serving cold.
+# Must stay well below the gunicorn worker timeout.
+WARMUP_BUDGET = 10.0
+
+# Seconds between heartbeats sent while waiting for the warmup to finish
+HEARTBEAT_INTERVAL = 1.0
+
+# Seconds to wait for the database to accept a connection during warmup
+CONNECT_TIMEOUT = 3
+
+# Query strings requested for each endpoint in addition to the bare URL,
+# so that every finder the route can call has its statement compiled
+WARMUP_QUERIES = {
+    "list_products": ["name=warmup", "category=FOOD", "available=true"],
+}
+
+
+######################################################################
+# RESET THE CONNECTION POOL AFTER FORK
+######################################################################
+def reset_connections(app):
+    """
+    Replace the database connection pool with an empty one
+
+    Connections opened before a fork are shared with the parent process.
+    The inherited pool is dropped without closing its connections, since
+    closing them would also shut the sockets the parent and the other
+    workers are still using. The worker then opens its own connections
+    on first use.
+    """
+    from service.models import db  # pylint: disable=import-outside-toplevel
+
+    with app.app_context():
+        db.engine.dispose(close=False)
+
+
+######################################################################
+# WARM UP A WORKER
+######################################################################
+def warm_up(app, budget=WARMUP_BUDGET, heartbeat=None):
+    """
+    Prepare a worker to serve requests
+
+    Opens a database connection, then calls every GET route, including
+    each query string in WARMUP_QUERIES, so that SQLAlchemy caches the
+    compiled statements and the first real request does not pay for any
+    of it.
+
+    The steps run in a background thread so that a slow or unreachable
+    database cannot hang the worker: `heartbeat` is called at least every
+    HEARTBEAT_INTERVAL seconds while waiting, and once `budget` seconds
+    have passed the remaining steps are skipped and TimeoutError is
+    raised. A step that is still running at that point is abandoned but
+    keeps running in the background while the worker serves requests.
+    Returns the number of seconds spent warming up.
+    """
+    start = time.monotonic()
+    deadline = start + budget
+    errors = []
+    runner = threading.Thread(
+        target=_run_steps, args=(app, deadline, errors), daemon=True
+    )
+    runner.start()
+    while True:
+        if heartbeat is not None:
+            heartbeat()
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        runner.join(min(HEARTBEAT_INTERVAL, remaining))
+        if not runner.is_alive():
+            break
+
+    if errors:
+        raise errors[0]
+    if runner.is_alive():
+        raise TimeoutError(f"Warmup did not finish within {budget} seconds")
+    return time.monotonic() - start
+
+
+def _run_steps(app, deadline, errors):
+    """Runs each warmup step until one fails or the deadline passes"""
+    steps = [_open_connection]
+    steps += [_get_url(url) for url in _read_only_urls(app)]
+    try:
+        for step in steps:
+            if time.monotonic() >= deadline:
+                raise TimeoutError("Warmup ran out of time before all steps completed")
+            step(app)
+    except Exception as error:  # pylint: disable=broad-except
+        errors.append(error)
+
+
+def _open_connection(app):
+    """
+    Fills the pool with a live database connection
+
+    PostgreSQL is probed first with a throwaway connection that gives up
+    after CONNECT_TIMEOUT seconds, since the driver waits indefinitely by
+    default and a dead database would otherwise leave the thread stuck
+    """
+    from service.models import db  # pylint: disable=import-outside-toplevel
+
+    with app.app_context():
+        engine = db.engine
+        if engine.dialect.name == "postgresql":
+            probe = create_engine(
+                engine.url,
+                poolclass=NullPool,
+                connect_args={"connect_timeout": CONNECT_TIMEOUT},
+            )
+            try:
+                with probe.connect() as connection:
+                    connection.execute(text("SELECT 1"))
+            finally:
+                probe.dispose()
+
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+
+
+def _get_url(url):
+    """Returns a warmup step that requests a single URL"""
+    def step(app):
+        response = app.test_client().get(url)
+        app.logger.debug("Warmup GET %s returned %s", url, response.status_code)
+    return step
+
+
+def _read_only_urls(app):
+    """Returns the warmup URLs for every GET route, skipping static files"""
+    urls = []
+    for rule in app.url_map.iter_rules():
+        if "GET" not in rule.methods or rule.endpoint == "static":
+            continue
+        values = {argument: WARMUP_ARG for argument in rule.arguments}
+        url = rule.build(values, append_unknown=False)[1]
+        urls.append(url)
+        urls += [f"{url}?{query}" for query in WARMUP_QUERIES.get(rule.endpoint, [])]
+    return urls